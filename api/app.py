@@ -4,21 +4,203 @@ Flask REST API - bridge between Frontend ↔ Backend, connects all modules.
 """
 
 import os
+import shutil
 import uuid
 from pathlib import Path
-from flask import Flask, request, jsonify, send_from_directory
+from flask import Flask, Response, current_app, request, jsonify, send_file, send_from_directory, stream_with_context
+from werkzeug.exceptions import BadRequest
+from werkzeug.utils import secure_filename
 
 from api.services import PipelineService, ASSETS_DIR
 
 # Allowed extensions for uploads (from project config)
-ALLOWED_EXTENSIONS_FILE = {"pdf", "docx"}
-ALLOWED_EXTENSIONS_IMAGE = {"png", "jpg", "jpeg", "bmp", "tiff", "webp"}
+ALLOWED_EXTENSIONS_FILE = frozenset({"pdf", "docx"})
+ALLOWED_EXTENSIONS_IMAGE = frozenset({"png", "jpg", "jpeg", "bmp", "tiff", "webp"})
 MAX_CONTENT_LENGTH_MB = 10
+UPLOAD_CHUNK_SIZE = 64 * 1024
+SAVE_BUFFER_SIZE = 1 << 20
+AUDIO_MAX_AGE = 3600  # Audio filenames are unique/content-addressed, safe to cache
+
+# Let a reverse proxy send audio bytes via sendfile(2) instead of Python:
+#   USE_X_SENDFILE=true            -> Apache/lighttpd X-Sendfile
+#   X_ACCEL_REDIRECT_PREFIX=/_audio/ -> nginx internal location aliased to assets/
+USE_X_SENDFILE = os.getenv("USE_X_SENDFILE", "").lower() in ("1", "true")
+X_ACCEL_REDIRECT_PREFIX = os.getenv("X_ACCEL_REDIRECT_PREFIX", "")
+
+
+def _ext(filename):
+    """Lowercase extension without the dot ('' if none)."""
+    return os.path.splitext(filename)[1][1:].lower()
+
+
+def _audio_response(chunks, headers=None):
+    """
+    Stream audio chunks with the Content-Type of the actual format: offline
+    TTS tiers may produce WAV, so the first chunk is sniffed for a RIFF header.
+    """
+    first = next(chunks, b"")
+    mimetype = "audio/wav" if first[:4] == b"RIFF" else "audio/mpeg"
+
+    def body():
+        try:
+            if first:
+                yield first
+            yield from chunks
+        finally:
+            chunks.close()
+
+    return Response(stream_with_context(body()), mimetype=mimetype, headers=headers)
+
+
+def _save_upload(f, path):
+    """Save a Werkzeug FileStorage with 1 MiB copies (FileStorage.save uses 16 KB)."""
+    with open(path, "wb", buffering=SAVE_BUFFER_SIZE) as out:
+        shutil.copyfileobj(f.stream, out, length=SAVE_BUFFER_SIZE)
+
+
+def _stream_upload(file_fields, value_fields=()):
+    """
+    Parse a multipart/form-data body incrementally, writing file fields
+    straight to assets/temp as the socket is read (skips Werkzeug's formparser).
+    Falls back to request.files when streaming-form-data is not installed.
+
+    Args:
+        file_fields: {form field name: allowed extensions}
+        value_fields: plain form fields to capture (e.g. input_type, language)
+
+    Returns:
+        (paths, values) - paths maps field -> saved file path, or "" if the
+        upload had a disallowed extension; fields not sent are absent.
+    """
+    upload_dir = Path(current_app.config["UPLOAD_DIR"])
+    paths, values = {}, {}
+
+    try:
+        from streaming_form_data import StreamingFormDataParser
+        from streaming_form_data.parser import ParseFailedException
+        from streaming_form_data.targets import FileTarget, ValueTarget
+    except ImportError:
+        for name, allowed in file_fields.items():
+            f = request.files.get(name)
+            if not (f and f.filename):
+                continue
+            ext = _ext(f.filename)
+            if ext not in allowed:
+                paths[name] = ""
+                continue
+            path = str(upload_dir / f"{uuid.uuid4().hex}.{ext}")
+            _save_upload(f, path)
+            paths[name] = path
+        for name in value_fields:
+            if name in request.form:
+                values[name] = request.form[name]
+        return paths, values
+
+    try:
+        parser = StreamingFormDataParser(headers=request.headers)
+    except ParseFailedException as e:
+        raise BadRequest(f"Malformed multipart/form-data body: {e}")
+    file_targets = {}
+    for name in file_fields:
+        # Final extension is only known once the part headers are parsed
+        file_targets[name] = FileTarget(str(upload_dir / f"{uuid.uuid4().hex}.upload"))
+        parser.register(name, file_targets[name])
+    value_targets = {name: ValueTarget() for name in value_fields}
+    for name, target in value_targets.items():
+        parser.register(name, target)
+
+    try:
+        while True:
+            chunk = request.stream.read(UPLOAD_CHUNK_SIZE)
+            if not chunk:
+                break
+            parser.data_received(chunk)
+    except Exception as e:
+        for target in file_targets.values():
+            if os.path.exists(target.filename):
+                os.remove(target.filename)
+        # A malformed body is the client's error (400), like Werkzeug's own parser
+        if isinstance(e, ParseFailedException):
+            raise BadRequest(f"Malformed multipart/form-data body: {e}")
+        raise
+
+    for name, target in file_targets.items():
+        if not os.path.exists(target.filename):
+            continue
+        ext = _ext(target.multipart_filename or "")
+        if not target.multipart_filename or ext not in file_fields[name]:
+            os.remove(target.filename)
+            if target.multipart_filename:
+                paths[name] = ""
+            continue
+        path = str(Path(target.filename).with_suffix(f".{ext}"))
+        os.replace(target.filename, path)
+        paths[name] = path
+    for name, target in value_targets.items():
+        if target.value:
+            values[name] = target.value.decode("utf-8", errors="replace")
+    return paths, values
+
+
+def _read_pipeline_request():
+    """Read (input_type, text, file_path, image_path) from a JSON or form pipeline request."""
+    if request.is_json:
+        data = request.get_json()
+        input_type = (data.get("input_type") or "").strip().lower()
+        text = (data.get("text") or "").strip()
+        file_path = (data.get("file_path") or "").strip()
+        image_path = (data.get("image_path") or "").strip()
+    elif request.mimetype == "multipart/form-data":
+        paths, form = _stream_upload(
+            {"file": ALLOWED_EXTENSIONS_FILE, "image": ALLOWED_EXTENSIONS_IMAGE},
+            ("input_type", "text", "file_path", "image_path"),
+        )
+        input_type = (form.get("input_type") or "").strip().lower()
+        text = (form.get("text") or "").strip()
+        file_path = (form.get("file_path") or "").strip()
+        image_path = (form.get("image_path") or "").strip()
+
+        # Keep only the upload matching input_type
+        for field, path in paths.items():
+            if path and field == input_type:
+                if field == "file":
+                    file_path = path
+                else:
+                    image_path = path
+            elif path:
+                os.remove(path)
+    else:
+        input_type = (request.form.get("input_type") or "").strip().lower()
+        text = (request.form.get("text") or "").strip()
+        file_path = (request.form.get("file_path") or "").strip()
+        image_path = (request.form.get("image_path") or "").strip()
+
+    return input_type, text, file_path, image_path
+
+
+def _cleanup_pipeline_uploads(input_type, file_path, image_path):
+    """Remove temp uploads used by a pipeline request."""
+    if input_type == "file" and file_path and os.path.exists(file_path) and "temp" in file_path:
+        try:
+            os.remove(file_path)
+        except Exception:
+            pass
+    if input_type == "image" and image_path and os.path.exists(image_path) and "temp" in image_path:
+        try:
+            os.remove(image_path)
+        except Exception:
+            pass
 
 
 def create_app():
     app = Flask(__name__)
     app.config["MAX_CONTENT_LENGTH"] = MAX_CONTENT_LENGTH_MB * 1024 * 1024
+    app.config["USE_X_SENDFILE"] = USE_X_SENDFILE
+
+    # Temp upload dir is created once here, not on every upload request
+    upload_dir = Path(ASSETS_DIR) / "temp"
+    upload_dir.mkdir(parents=True, exist_ok=True)
+    app.config["UPLOAD_DIR"] = str(upload_dir)
 
     # CORS for frontend (enable when frontend is added)
     try:
@@ -27,8 +209,29 @@ def create_app():
     except ImportError:
         pass
 
+    # Compress JSON responses (text previews/extracted text compress well).
+    # Audio is already compressed, so only JSON is listed.
+    app.config["COMPRESS_MIMETYPES"] = ["application/json"]
+    app.config["COMPRESS_LEVEL"] = 5
+    app.config["COMPRESS_ALGORITHM"] = ["br", "gzip"]
+    try:
+        from flask_compress import Compress
+        Compress(app)
+    except ImportError:
+        pass
+
     service = PipelineService()
 
+    # Warm up OCR models at startup so the first /extract/image call doesn't
+    # pay the EasyOCR model-load cost on the request thread.
+    try:
+        from modules.ocr_engine import warm_up
+        warm_up()
+    except ImportError:
+        pass
+    except Exception as e:
+        print(f"[WARN] OCR warm-up failed: {e}")
+
     # --- Root (so GET / doesn't 404) ---
     @app.route("/", methods=["GET"])
     def index():
@@ -91,17 +294,13 @@ def create_app():
     def extract_file():
         """Extract text from PDF/DOCX (Module 2). Upload file or send file_path."""
         file_path = None
-        if "file" in request.files:
-            f = request.files["file"]
-            if f.filename:
-                ext = Path(f.filename).suffix.lower().lstrip(".")
-                if ext not in ALLOWED_EXTENSIONS_FILE:
-                    return jsonify({"success": False, "error": "Only .pdf, .docx allowed"}), 400
-                safe_name = f"{uuid.uuid4().hex}{Path(f.filename).suffix}"
-                upload_dir = Path(ASSETS_DIR) / "temp"
-                upload_dir.mkdir(parents=True, exist_ok=True)
-                file_path = str(upload_dir / safe_name)
-                f.save(file_path)
+        uploaded = False
+        if request.mimetype == "multipart/form-data":
+            paths, _ = _stream_upload({"file": ALLOWED_EXTENSIONS_FILE})
+            if paths.get("file") == "":
+                return jsonify({"success": False, "error": "Only .pdf, .docx allowed"}), 400
+            file_path = paths.get("file")
+            uploaded = bool(file_path)
         if not file_path:
             data = request.get_json(silent=True) or {}
             file_path = (data.get("file_path") or "").strip()
@@ -111,7 +310,7 @@ def create_app():
             result = service.get_text_from_file(file_path)
         finally:
             # Cleanup temp upload if it was uploaded in this request
-            if "file" in request.files and file_path and os.path.exists(file_path) and "temp" in file_path:
+            if uploaded and os.path.exists(file_path):
                 try:
                     os.remove(file_path)
                 except Exception:
@@ -122,28 +321,25 @@ def create_app():
     def extract_image():
         """Extract text from image via OCR (Module 3). Upload image or send image_path."""
         image_path = None
-        if "image" in request.files:
-            f = request.files["image"]
-            if f.filename:
-                ext = Path(f.filename).suffix.lower().lstrip(".")
-                if ext not in ALLOWED_EXTENSIONS_IMAGE:
-                    return jsonify({"success": False, "error": "Only image formats allowed"}), 400
-                safe_name = f"{uuid.uuid4().hex}{Path(f.filename).suffix}"
-                upload_dir = Path(ASSETS_DIR) / "temp"
-                upload_dir.mkdir(parents=True, exist_ok=True)
-                image_path = str(upload_dir / safe_name)
-                f.save(image_path)
+        uploaded = False
+        form = {}
+        if request.mimetype == "multipart/form-data":
+            paths, form = _stream_upload({"image": ALLOWED_EXTENSIONS_IMAGE}, ("language",))
+            if paths.get("image") == "":
+                return jsonify({"success": False, "error": "Only image formats allowed"}), 400
+            image_path = paths.get("image")
+            uploaded = bool(image_path)
         if not image_path:
             data = request.get_json(silent=True) or {}
             image_path = (data.get("image_path") or "").strip()
         if not image_path or not os.path.isfile(image_path):
             return jsonify({"success": False, "error": "Missing image upload or valid image_path"}), 400
-        lang = (request.get_json(silent=True) or request.form or {}).get("language", "mixed")
+        lang = (request.get_json(silent=True) or form).get("language", "mixed")
         try:
             result = service.get_text_from_image(image_path, language=lang)
         finally:
             # Cleanup temp upload
-            if "image" in request.files and image_path and os.path.exists(image_path) and "temp" in image_path:
+            if uploaded and os.path.exists(image_path):
                 try:
                     os.remove(image_path)
                 except Exception:
@@ -168,9 +364,20 @@ def create_app():
         if not text:
             return jsonify({"success": False, "error": "Missing 'text'"}), 400
         lang = (data.get("language") or "").strip() or None
-        result = service.generate_speech(text, language=lang)
+        parallel = request.args.get("parallel", "").lower() == "true"
+        result = service.generate_speech(text, language=lang, parallel=parallel)
         return jsonify(result)
 
+    @app.route("/api/v1/tts/stream", methods=["POST"])
+    def tts_stream():
+        """Stream speech audio while it is being generated (Module 5). Optional language: en | ur."""
+        data = request.get_json(silent=True) or {}
+        text = (data.get("text") or "").strip()
+        if not text:
+            return jsonify({"success": False, "error": "Missing 'text'"}), 400
+        lang = (data.get("language") or "").strip() or None
+        return _audio_response(service.generate_speech_stream(text, language=lang))
+
     # --- Full pipeline (real-time: one request → text + audio URL) ---
 
     @app.route("/api/v1/pipeline", methods=["GET", "POST"])
@@ -189,47 +396,7 @@ def create_app():
                 "curl_example": "curl -X POST http://127.0.0.1:5000/api/v1/pipeline -H \"Content-Type: application/json\" -d \"{\\\"input_type\\\": \\\"text\\\", \\\"text\\\": \\\"Hello\\\"}\"",
             })
 
-        input_type = None
-        text = None
-        file_path = None
-        image_path = None
-
-        if request.is_json:
-            data = request.get_json()
-            input_type = (data.get("input_type") or "").strip().lower()
-            text = (data.get("text") or "").strip()
-            file_path = (data.get("file_path") or "").strip()
-            image_path = (data.get("image_path") or "").strip()
-        else:
-            input_type = (request.form.get("input_type") or "").strip().lower()
-            text = (request.form.get("text") or "").strip()
-            file_path = (request.form.get("file_path") or "").strip()
-            image_path = (request.form.get("image_path") or "").strip()
-
-        # Handle file upload for file
-        if input_type == "file" and "file" in request.files:
-            f = request.files["file"]
-            if f.filename:
-                ext = Path(f.filename).suffix.lower().lstrip(".")
-                if ext in ALLOWED_EXTENSIONS_FILE:
-                    safe_name = f"{uuid.uuid4().hex}{Path(f.filename).suffix}"
-                    upload_dir = Path(ASSETS_DIR) / "temp"
-                    upload_dir.mkdir(parents=True, exist_ok=True)
-                    file_path = str(upload_dir / safe_name)
-                    f.save(file_path)
-
-        # Handle file upload for image
-        if input_type == "image" and "image" in request.files:
-            f = request.files["image"]
-            if f.filename:
-                ext = Path(f.filename).suffix.lower().lstrip(".")
-                if ext in ALLOWED_EXTENSIONS_IMAGE:
-                    safe_name = f"{uuid.uuid4().hex}{Path(f.filename).suffix}"
-                    upload_dir = Path(ASSETS_DIR) / "temp"
-                    upload_dir.mkdir(parents=True, exist_ok=True)
-                    image_path = str(upload_dir / safe_name)
-                    f.save(image_path)
-
+        input_type, text, file_path, image_path = _read_pipeline_request()
         if input_type not in ("text", "file", "image"):
             return jsonify({"success": False, "error": "input_type must be: text, file, or image"}), 400
 
@@ -239,30 +406,61 @@ def create_app():
                 text=text or None,
                 file_path=file_path or None,
                 image_path=image_path or None,
+                parallel=request.args.get("parallel", "").lower() == "true",
             )
         finally:
-            # Cleanup temp files
-            if input_type == "file" and file_path and os.path.exists(file_path) and "temp" in file_path:
-                try:
-                    os.remove(file_path)
-                except Exception:
-                    pass
-            if input_type == "image" and image_path and os.path.exists(image_path) and "temp" in image_path:
-                try:
-                    os.remove(image_path)
-                except Exception:
-                    pass
+            _cleanup_pipeline_uploads(input_type, file_path, image_path)
 
         if not result.get("success"):
             return jsonify(result), 400
         return jsonify(result)
 
+    @app.route("/api/v1/pipeline/stream", methods=["POST"])
+    def pipeline_stream():
+        """
+        Fused streaming pipeline: same input as /api/v1/pipeline, but the
+        response body is audio streamed sentence by sentence (MP3, or WAV
+        when only the offline tiers are available).
+        Metadata is returned in X-Language / X-Char-Count headers.
+        """
+        input_type, text, file_path, image_path = _read_pipeline_request()
+        if input_type not in ("text", "file", "image"):
+            return jsonify({"success": False, "error": "input_type must be: text, file, or image"}), 400
+
+        try:
+            meta, chunks = service.fused_pipeline(
+                input_type=input_type,
+                text=text or None,
+                file_path=file_path or None,
+                image_path=image_path or None,
+            )
+        finally:
+            # Text is fully extracted at this point; uploads are no longer needed
+            _cleanup_pipeline_uploads(input_type, file_path, image_path)
+
+        if not meta.get("success"):
+            return jsonify(meta), 400
+        return _audio_response(
+            chunks,
+            headers={"X-Language": meta["language"], "X-Char-Count": str(meta["char_count"])},
+        )
+
     # --- Serve generated audio (for frontend playback) ---
 
     @app.route("/api/v1/audio/<filename>", methods=["GET"])
     def serve_audio(filename):
         """Serve generated audio file for frontend (real-time playback)."""
-        return send_from_directory(ASSETS_DIR, filename, as_attachment=False)
+        safe_name = secure_filename(filename)
+        audio_path = Path(ASSETS_DIR) / safe_name
+        if not safe_name or not audio_path.is_file():
+            return jsonify({"success": False, "error": "Audio file not found"}), 404
+        if X_ACCEL_REDIRECT_PREFIX:
+            # nginx streams the file itself; Python only sends headers
+            response = Response(status=200)
+            response.headers["X-Accel-Redirect"] = X_ACCEL_REDIRECT_PREFIX.rstrip("/") + "/" + safe_name
+            response.headers["Cache-Control"] = f"public, max-age={AUDIO_MAX_AGE}"
+            return response
+        return send_file(audio_path, conditional=True, max_age=AUDIO_MAX_AGE)
 
     return app
 
@@ -206,8 +206,13 @@ even when torch/easyocr are not installed (e.g. Python 3.13, no Rust).
 """
 
 import asyncio
+import hashlib
 import os
+import re
+import shutil
+import threading
 import uuid
+from concurrent.futures import ThreadPoolExecutor, wait
 from pathlib import Path
 from typing import Optional, Literal
 
@@ -229,14 +234,58 @@ ASSETS_DIR = Path(ASSETS_DIR)
 ASSETS_DIR.mkdir(parents=True, exist_ok=True)
 
 
-def run_async(coro):
-    """Run async TTS from sync Flask view."""
-    try:
-        loop = asyncio.get_event_loop()
-    except RuntimeError:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-    return loop.run_until_complete(coro)
+# Max seconds a Flask worker waits on one TTS job (first offline run loads models)
+TTS_TIMEOUT_SECONDS = 120
+# Max TTS jobs in flight on the shared event loop
+TTS_MAX_CONCURRENCY = 4
+# Online-tier audio files kept in the cache (least recently used are evicted)
+TTS_CACHE_MAX_FILES = 256
+# Worker threads for sentence-level parallel TTS
+TTS_PARALLEL_WORKERS = 4
+# Sentences synthesized ahead of the one being streamed
+TTS_STREAM_WINDOW = 3
+
+# Sentence boundaries: English . ! ? and Urdu full stop ۔
+SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?۔])\s+")
+
+
+def _split_sentences(text: str) -> list:
+    """Split text into sentences for parallel TTS."""
+    return [s for s in SENTENCE_SPLIT_RE.split(text) if s.strip()]
+
+
+def _is_mp3_part(path: str, tier: str) -> bool:
+    """True if a synthesized part is real MP3 (pyttsx3 writes its own format under any name)."""
+    return path.endswith(".mp3") and tier != "system"
+
+
+def _remove_parts(names: list) -> None:
+    """Delete part files (and any WAV fallbacks of them) from ASSETS_DIR."""
+    for name in names:
+        part = ASSETS_DIR / name
+        for leftover in (part, part.with_suffix(".wav")):
+            try:
+                os.remove(leftover)
+            except OSError:
+                pass
+
+
+def _prune_cache() -> None:
+    """Evict least recently used cache files beyond TTS_CACHE_MAX_FILES."""
+    entries = []
+    for path in ASSETS_DIR.glob("tts_*"):
+        try:
+            entries.append((path.stat().st_mtime, path))
+        except OSError:
+            pass
+    if len(entries) <= TTS_CACHE_MAX_FILES:
+        return
+    entries.sort()
+    for _, path in entries[:len(entries) - TTS_CACHE_MAX_FILES]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
 
 
 class PipelineService:
@@ -250,6 +299,34 @@ class PipelineService:
         # Convert Path to string for TTSEngine
         self._tts.output_dir = str(ASSETS_DIR)
 
+        # One persistent event loop thread drives all TTS jobs, so Flask
+        # workers submit coroutines instead of creating/running loops per request.
+        self._loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(
+            target=self._loop.run_forever, name="tts-loop", daemon=True
+        )
+        self._loop_thread.start()
+        self._tts_slots = asyncio.Semaphore(TTS_MAX_CONCURRENCY)
+        # Sentence-level parallel TTS gets its own workers: they block on the
+        # loop, which runs backends on the shared pool, so they can't live there
+        self._tts_pool = ThreadPoolExecutor(
+            max_workers=TTS_PARALLEL_WORKERS, thread_name_prefix="tts-sentence"
+        )
+
+    def run_async(self, coro, timeout: float = TTS_TIMEOUT_SECONDS):
+        """Run a coroutine on the shared TTS loop and block until it finishes."""
+        future = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        try:
+            return future.result(timeout=timeout)
+        except Exception:
+            future.cancel()
+            raise
+
+    async def _bounded(self, coro):
+        """Limit how many TTS jobs run concurrently on the loop."""
+        async with self._tts_slots:
+            return await coro
+
     # --- Step 1: Text extraction (from text, file, or image) ---
 
     def get_text_from_input(self, text: str) -> dict:
@@ -318,23 +395,100 @@ class PipelineService:
 
     # --- Step 3: TTS generation (Module 5) ---
 
-    def generate_speech(self, text: str, language: Optional[str] = None) -> dict:
-        """Generate speech (Module 5 - TTS). Language: 'en' or 'ur'."""
-        if not language:
-            language = quick_detect(text)
-        lang_voice = "urdu" if language == "ur" else "english"
-        filename = f"audio_{language}_{uuid.uuid4().hex[:8]}.mp3"
-        try:
-            path = run_async(
+    def _tts_one(self, text: str, lang_voice: str, filename: str) -> tuple:
+        """Synthesize one piece of text on the shared TTS loop, return (file path, tier)."""
+        return self.run_async(
+            self._bounded(
                 self._tts.generate_speech(
                     text,
                     language=lang_voice,
                     filename=filename,
+                    return_tier=True,
                 )
             )
+        )
+
+    def _tts_parallel(self, sentences: list, lang_voice: str, filename: str) -> Optional[tuple]:
+        """
+        Fan sentences out to the worker pool and join the MP3s in order.
+        Returns (path, tier), tier being "online" only if every part was;
+        None if any part isn't MP3 (can't be byte-concatenated).
+        """
+        names = [f"part_{uuid.uuid4().hex}.mp3" for _ in sentences]
+        futures = [
+            self._tts_pool.submit(self._tts_one, sentence, lang_voice, name)
+            for sentence, name in zip(sentences, names)
+        ]
+        try:
+            results = [future.result() for future in futures]
+            parts = [path for path, _ in results]
+            tiers = {tier for _, tier in results}
+            if not all(_is_mp3_part(path, tier) for path, tier in results):
+                return None
+            # MP3 frames are self-contained, so byte-level concat is valid
+            out_path = str(ASSETS_DIR / filename)
+            with open(out_path, "wb") as out:
+                for part in parts:
+                    with open(part, "rb") as f:
+                        shutil.copyfileobj(f, out)
+            return out_path, tiers.pop() if len(tiers) == 1 else "mixed"
+        finally:
+            # Parts still running would be written after cleanup, so let them finish first
+            for future in futures:
+                future.cancel()
+            wait(futures)
+            _remove_parts(names)
+
+    def generate_speech(self, text: str, language: Optional[str] = None, parallel: bool = False) -> dict:
+        """Generate speech (Module 5 - TTS). Language: 'en' or 'ur'.
+        parallel=True splits into sentences and synthesizes them concurrently."""
+        if not language:
+            language = quick_detect(text)
+        lang_voice = "urdu" if language == "ur" else "english"
+
+        # Audio cache: identical text + language reuses the previous file.
+        # Only online-tier (Edge MP3) results are cached, so a degraded offline
+        # result is never served once the online tier is back.
+        key = hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+        cached = ASSETS_DIR / f"tts_{language}_{key}.mp3"
+        try:
+            if cached.stat().st_size > 0:
+                os.utime(cached)  # mark as recently used for eviction
+                return {
+                    "success": True,
+                    "audio_path": str(cached),
+                    "audio_url": f"/api/v1/audio/{cached.name}",
+                    "language": language,
+                    "filename": cached.name,
+                    "cached": True,
+                }
+        except OSError:
+            pass
+
+        # Synthesize under a unique temp name and move it into the cache only
+        # once complete, so readers never see a partial or in-progress file
+        tmp_name = f"tmp_{uuid.uuid4().hex}.mp3"
+        try:
+            path, tier = None, None
+            if parallel:
+                sentences = _split_sentences(text)
+                if len(sentences) > 1:
+                    path, tier = self._tts_parallel(sentences, lang_voice, tmp_name) or (None, None)
+            if not path:
+                path, tier = self._tts_one(text, lang_voice, tmp_name)
+            if not path:
+                return {"success": False, "error": "No text to synthesize", "audio_path": None}
             
             # FIX: If TTS changed extension (e.g. mp3 -> wav for offline), update filename
-            actual_filename = os.path.basename(path)
+            if tier == "online":
+                final_path = cached
+            else:
+                final_path = ASSETS_DIR / f"audio_{language}_{uuid.uuid4().hex[:16]}{Path(path).suffix}"
+            os.replace(path, final_path)
+            if tier == "online":
+                _prune_cache()
+            path = str(final_path)
+            actual_filename = final_path.name
             
             return {
                 "success": True,
@@ -344,22 +498,52 @@ class PipelineService:
                 "filename": actual_filename,
             }
         except Exception as e:
-            return {"success": False, "error": str(e), "audio_path": None}
+            return {"success": False, "error": str(e) or type(e).__name__, "audio_path": None}
+        finally:
+            tmp_path = ASSETS_DIR / tmp_name
+            for leftover in (tmp_path, tmp_path.with_suffix(".wav")):
+                try:
+                    os.remove(leftover)
+                except OSError:
+                    pass
+
+    def generate_speech_stream(self, text: str, language: Optional[str] = None):
+        """Yield audio bytes as they are synthesized (Module 5 - streaming TTS)."""
+        if not language:
+            language = quick_detect(text)
+        lang_voice = "urdu" if language == "ur" else "english"
+        # No filename: the offline fallback writes a temp file the engine deletes after
+        # streaming, never a cache entry another request could read half-written
+        chunks = self._tts.stream_speech(text, language=lang_voice)
+
+        async def next_chunk():
+            try:
+                return await chunks.__anext__()
+            except StopAsyncIteration:
+                return None
+
+        async def close():
+            await chunks.aclose()
+
+        try:
+            while True:
+                chunk = self.run_async(next_chunk())
+                if chunk is None:
+                    break
+                yield chunk
+        finally:
+            self.run_async(close())
 
     # --- Full pipeline (extract → detect → TTS) ---
 
-    def run_pipeline(
+    def _extract_text(
         self,
-        input_type: Literal["text", "file", "image"],
-        text: Optional[str] = None,
-        file_path: Optional[str] = None,
-        image_path: Optional[str] = None,
+        input_type: str,
+        text: Optional[str],
+        file_path: Optional[str],
+        image_path: Optional[str],
     ) -> dict:
-        """
-        Full pipeline: Extract text → Detect language → Generate speech.
-        Real-time response with audio URL for frontend.
-        """
-        # 1) Get text
+        """Pipeline step 1: get text from text, file, or image input."""
         if input_type == "text" and text:
             step1 = self.get_text_from_input(text)
         elif input_type == "file" and file_path:
@@ -375,16 +559,109 @@ class PipelineService:
         if not step1.get("success"):
             return {"success": False, "error": step1.get("error", "Extraction failed"), "step": "extract"}
 
-        extracted_text = step1["text"]
-        if not (extracted_text and extracted_text.strip()):
+        if not (step1["text"] and step1["text"].strip()):
             return {"success": False, "error": "No text to process", "step": "extract"}
+        return step1
+
+    def fused_pipeline(
+        self,
+        input_type: Literal["text", "file", "image"],
+        text: Optional[str] = None,
+        file_path: Optional[str] = None,
+        image_path: Optional[str] = None,
+    ):
+        """
+        Streaming pipeline: Extract text → detect language on the first
+        sentence only → synthesize sentences on the TTS pool, a few ahead
+        of the one being streamed. TTS starts without waiting on a
+        full-text detection pass.
+
+        Returns (meta, chunks): meta is the status dict for the client,
+        chunks yields MP3 bytes in sentence order (None on failure).
+        """
+        step1 = self._extract_text(input_type, text, file_path, image_path)
+        if not step1.get("success"):
+            return step1, None
+        extracted_text = step1["text"]
+
+        sentences = _split_sentences(extracted_text) or [extracted_text]
+        lang = quick_detect(sentences[0])
+        meta = {
+            "success": True,
+            "text_preview": extracted_text[:200],
+            "char_count": len(extracted_text),
+            "language": lang,
+        }
+
+        # Offline, synthesize the text as one piece: only Edge output is guaranteed
+        # MP3 (MMS writes WAV without ffmpeg, pyttsx3 writes the platform's format)
+        if not self.run_async(self._tts.can_stream_online()):
+            return meta, self.generate_speech_stream(extracted_text, language=lang)
+
+        lang_voice = "urdu" if lang == "ur" else "english"
+        return meta, self._stream_parts(sentences, lang_voice)
+
+    def _stream_parts(self, sentences: list, lang_voice: str, chunk_size: int = 64 * 1024):
+        """
+        Yield each sentence's audio bytes in order, keeping at most
+        TTS_STREAM_WINDOW sentences in flight. Parts are deleted on exit,
+        including when the client disconnects mid-stream.
+        """
+        names = [f"stream_{uuid.uuid4().hex}.mp3" for _ in sentences]
+        futures = []
+
+        def submit_next():
+            i = len(futures)
+            if i < len(sentences):
+                futures.append(self._tts_pool.submit(self._tts_one, sentences[i], lang_voice, names[i]))
+
+        try:
+            for _ in range(TTS_STREAM_WINDOW):
+                submit_next()
+            for i in range(len(sentences)):
+                path, tier = futures[i].result()
+                submit_next()
+                if not _is_mp3_part(path, tier):
+                    # A WAV/system-voice part can't be spliced into an MP3 stream
+                    print(f"[WARN] Skipping non-MP3 sentence {i + 1}/{len(sentences)} ({tier} tier)")
+                    continue
+                with open(path, "rb") as f:
+                    while True:
+                        chunk = f.read(chunk_size)
+                        if not chunk:
+                            break
+                        yield chunk
+                os.remove(path)
+        finally:
+            for future in futures:
+                future.cancel()
+            wait(futures)
+            _remove_parts(names)
+
+    def run_pipeline(
+        self,
+        input_type: Literal["text", "file", "image"],
+        text: Optional[str] = None,
+        file_path: Optional[str] = None,
+        image_path: Optional[str] = None,
+        parallel: bool = False,
+    ) -> dict:
+        """
+        Full pipeline: Extract text → Detect language → Generate speech.
+        Real-time response with audio URL for frontend.
+        """
+        # 1) Get text
+        step1 = self._extract_text(input_type, text, file_path, image_path)
+        if not step1.get("success"):
+            return step1
+        extracted_text = step1["text"]
 
         # 2) Detect language
         step2 = self.detect_language(extracted_text)
         lang = step2["language"]
 
         # 3) Generate speech
-        step3 = self.generate_speech(extracted_text, language=lang)
+        step3 = self.generate_speech(extracted_text, language=lang, parallel=parallel)
         if not step3.get("success"):
             return {
                 "success": False,
@@ -0,0 +1,95 @@
+"""
+Device selection for torch-based models (EasyOCR, MMS)
+"""
+
+import os
+import platform
+import threading
+from typing import Literal
+
+Device = Literal['auto', 'cpu', 'cuda', 'mps']
+
+
+def detect_device() -> str:
+    """Best available torch device: 'cuda', then 'mps', else 'cpu'"""
+    try:
+        import torch
+    except ImportError:
+        return 'cpu'
+
+    if torch.cuda.is_available():
+        return 'cuda'
+    mps = getattr(torch.backends, 'mps', None)
+    if mps is not None and mps.is_available():
+        return 'mps'
+    return 'cpu'
+
+
+def resolve_device(device: Device = 'auto') -> str:
+    """Resolve 'auto' to a concrete device"""
+    return detect_device() if device == 'auto' else device
+
+
+def _has_avx2() -> bool:
+    """x86 AVX2 check (torch's CPU capability, else /proc/cpuinfo; assume yes if unknown)"""
+    try:
+        import torch
+        capability = torch.backends.cpu.get_cpu_capability()
+        if capability != 'DEFAULT':
+            return capability.startswith('AVX')
+    except Exception:
+        pass
+    if os.path.exists('/proc/cpuinfo'):
+        with open('/proc/cpuinfo', 'r', errors='ignore') as f:
+            return 'avx2' in f.read().lower()
+    return True
+
+
+def select_quantized_engine() -> bool:
+    """
+    Point torch's int8 kernels at the right backend before dynamic quantization:
+    fbgemm on x86 with AVX2, qnnpack on ARM.
+    Returns False where int8 would be emulated and slower than FP32 (skip quantizing).
+    """
+    import torch
+
+    machine = platform.machine().lower()
+    supported = torch.backends.quantized.supported_engines
+    if machine in ('x86_64', 'amd64', 'x86', 'i686'):
+        if not _has_avx2() or 'fbgemm' not in supported:
+            return False
+        torch.backends.quantized.engine = 'fbgemm'
+        return True
+    if 'arm' in machine or 'aarch64' in machine:
+        if 'qnnpack' not in supported:
+            return False
+        torch.backends.quantized.engine = 'qnnpack'
+        return True
+    return False
+
+
+_cpu_threads_configured = False
+_cpu_threads_lock = threading.Lock()
+
+
+def configure_cpu_threads():
+    """
+    One intra-op thread per physical core (assumes 2-way SMT) and a single
+    inter-op thread, so int8 GEMMs don't contend for hyperthread siblings.
+    Runs once per process. torch's thread pools are process-wide, so this
+    also applies to every other torch model in the process (e.g. EasyOCR).
+    """
+    global _cpu_threads_configured
+    with _cpu_threads_lock:
+        if _cpu_threads_configured:
+            return
+        _cpu_threads_configured = True
+
+    import torch
+
+    torch.set_num_threads(max(1, (os.cpu_count() or 2) // 2))
+    try:
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        # Only settable before the first inter-op parallel work
+        pass
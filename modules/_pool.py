@@ -0,0 +1,11 @@
+"""
+Process-wide worker threads shared by the OCR and TTS engines
+(Tesseract passes, sync SDK calls from async backends, sentence-level TTS)
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+SHARED_POOL = ThreadPoolExecutor(
+    max_workers=min(32, (os.cpu_count() or 4) * 2), thread_name_prefix='ocrtts'
+)
@@ -2,12 +2,23 @@
 Word Document Engine - Extract text from .docx files
 """
 
-from typing import Optional
+from typing import Iterator, Optional
 from dataclasses import dataclass
 from pathlib import Path
-from docx import Document
+import zipfile
+
+from lxml import etree
 from loguru import logger
 
+# python-docx is only needed as a fallback for documents the fast path can't read
+try:
+    from docx import Document
+except ImportError:
+    Document = None
+
+W_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+_W_P, _W_T, _W_TAB, _W_BR, _W_CR = (W_NS + tag for tag in ('p', 't', 'tab', 'br', 'cr'))
+
 
 @dataclass
 class DocxResult:
@@ -18,6 +29,39 @@ class DocxResult:
     error: Optional[str] = None
 
 
+def iter_paragraph_texts(source) -> Iterator[str]:
+    """
+    Stream paragraph texts straight from word/document.xml
+    (skips python-docx's paragraph/run/style object model)
+    
+    Args:
+        source: Path or binary file-like object of a .docx
+        
+    Yields:
+        Text of each paragraph (may be empty)
+    """
+    with zipfile.ZipFile(source) as archive, archive.open('word/document.xml') as fp:
+        parts = []
+        # Uploaded files are untrusted: never expand entities or fetch external DTDs
+        # (lxml < 5 resolves entities by default)
+        events = etree.iterparse(
+            fp, events=('end',), tag=(_W_P, _W_T, _W_TAB, _W_BR, _W_CR),
+            resolve_entities=False, no_network=True,
+        )
+        for _, el in events:
+            if el.tag == _W_T:
+                if el.text:
+                    parts.append(el.text)
+            elif el.tag == _W_TAB:
+                parts.append('\t')
+            elif el.tag == _W_P:
+                yield ''.join(parts)
+                parts = []
+            else:
+                parts.append('\n')
+            el.clear()
+
+
 def extract_text_from_docx(docx_path: str) -> DocxResult:
     """
     Extract text from Word document
@@ -37,9 +81,17 @@ def extract_text_from_docx(docx_path: str) -> DocxResult:
         if path.suffix.lower() != '.docx':
             return DocxResult(False, "", str(path), "Not a .docx file")
         
-        # Extract text from all paragraphs
-        doc = Document(path)
-        text = '\n'.join([paragraph.text for paragraph in doc.paragraphs if paragraph.text.strip()])
+        # Extract text from all paragraphs (one streaming pass over the XML)
+        try:
+            parts = iter_paragraph_texts(path)
+            text = '\n'.join(part for part in parts if part.strip())
+        except Exception as e:
+            if Document is None:
+                raise
+            logger.warning(f"Fast DOCX parse failed, using python-docx: {e}")
+            doc = Document(path)
+            parts = (paragraph.text for paragraph in doc.paragraphs)
+            text = '\n'.join(part for part in parts if part and part.strip())
         
         if not text.strip():
             return DocxResult(False, "", str(path), "No text found in document")
@@ -16,8 +16,9 @@ import io
 import PyPDF2
 import pdfplumber
 
-# Word document library
+# Word document library (python-docx is the fallback for the streaming XML reader)
 from docx import Document
+from modules.docx_engine import iter_paragraph_texts
 
 from loguru import logger
 
@@ -191,10 +192,7 @@ class FileExtractor:
         logger.info(f"Extracting DOCX: {path.name}")
         
         try:
-            doc = Document(path)
-            
-            # Extract all paragraphs
-            paragraphs = [para.text for para in doc.paragraphs if para.text.strip()]
+            paragraphs = self._docx_paragraphs(path)
             
             if not paragraphs:
                 return self._create_error_result(
@@ -219,6 +217,19 @@ class FileExtractor:
             return self._create_error_result(str(path), f"DOCX extraction error: {str(e)}")
     
     
+    def _docx_paragraphs(self, source) -> List[str]:
+        """Non-empty paragraph texts: streaming XML pass, python-docx as fallback"""
+        try:
+            return [part for part in iter_paragraph_texts(source) if part.strip()]
+        except Exception as e:
+            logger.warning(f"Fast DOCX parse failed, using python-docx: {e}")
+            if hasattr(source, 'seek'):
+                source.seek(0)
+            doc = Document(source)
+            parts = (para.text for para in doc.paragraphs)
+            return [part for part in parts if part and part.strip()]
+    
+    
     def extract_from_bytes(self, file_bytes: bytes, filename: str) -> ExtractionResult:
         """
         Extract text from file bytes (for file uploads in web apps)
@@ -276,8 +287,7 @@ class FileExtractor:
     def _extract_docx_from_bytes(self, file_bytes: bytes, filename: str) -> ExtractionResult:
         """Extract DOCX from bytes"""
         
-        doc = Document(io.BytesIO(file_bytes))
-        paragraphs = [para.text for para in doc.paragraphs if para.text.strip()]
+        paragraphs = self._docx_paragraphs(io.BytesIO(file_bytes))
         
         if not paragraphs:
             return self._create_error_result(filename, "No text found in document")
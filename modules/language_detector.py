@@ -2,12 +2,40 @@
 Module 4: Language Detection (Team Member Version - Simplified)
 """
 
+import hashlib
+import os
+import threading
+from collections import OrderedDict
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Optional
 from langdetect import detect
 from loguru import logger
 
-URDU_RANGE = range(0x0600, 0x06FF)
+# UTF-8 lead bytes of U+0600..U+06FF (every char in the block starts with one)
+URDU_LEAD_BYTES = (b'\xd8', b'\xd9', b'\xda', b'\xdb')
+
+# FastText language-ID model (lid.176.ftz), loaded once at import.
+# Falls back to langdetect when fasttext or the model file is unavailable.
+FASTTEXT_MODEL_PATH = Path(os.getenv(
+    "FASTTEXT_MODEL_PATH",
+    Path(__file__).resolve().parent.parent / "models" / "lid.176.ftz",
+))
+
+def _load_fasttext():
+    """Load FastText lid model once (cold load is slow, never reload per request)"""
+    try:
+        import fasttext
+        if not FASTTEXT_MODEL_PATH.exists():
+            return None
+        model = fasttext.load_model(str(FASTTEXT_MODEL_PATH))
+        logger.info(f"✅ FastText language model loaded ({FASTTEXT_MODEL_PATH.name})")
+        return model
+    except Exception as e:
+        logger.warning(f"FastText unavailable, using langdetect: {e}")
+        return None
+
+_FT = _load_fasttext()
 
 @dataclass
 class LanguageDetectionResult:
@@ -20,7 +48,9 @@ class LanguageDetectionResult:
 
 def is_urdu_unicode(text):
     """Check if >30% of chars are Urdu"""
-    urdu_chars = sum(1 for c in text if ord(c) in URDU_RANGE)
+    # bytes.count runs in C, no per-char Python objects
+    encoded = text.encode('utf-8')
+    urdu_chars = sum(encoded.count(lead) for lead in URDU_LEAD_BYTES)
     return urdu_chars / max(len(text), 1) > 0.3
 
 def detect_language(text: str) -> LanguageDetectionResult:
@@ -40,6 +70,21 @@ def detect_language(text: str) -> LanguageDetectionResult:
                 method="unicode"
             )
         
+        if _FT is not None:
+            # FastText rejects newlines in input. The low-level predict returns
+            # [(prob, label)]; the wrapper's np.array(copy=False) breaks on NumPy 2.
+            predictions = _FT.f.predict(text.replace("\n", " "), 1, 0.0, "strict")
+            prob, label = predictions[0] if predictions else (0.0, "")
+            detected = "ur" if label == "__label__ur" else "en"
+            logger.info(f"Detected {detected} via fasttext")
+            
+            return LanguageDetectionResult(
+                success=True,
+                language=detected,
+                confidence=round(float(prob) * 100, 1),
+                method="fasttext"
+            )
+        
         lang = detect(text)
         detected = "ur" if lang == "ur" else "en"
         logger.info(f"Detected {detected} via library")
@@ -60,7 +105,24 @@ def detect_language(text: str) -> LanguageDetectionResult:
             method="fallback"
         )
 
+# quick_detect results keyed by a 16-byte digest of the text (not the text itself,
+# which may be a whole document)
+QUICK_DETECT_CACHE_SIZE = 4096
+_quick_cache: OrderedDict = OrderedDict()
+_quick_cache_lock = threading.Lock()
+
 def quick_detect(text: str) -> str:
-    """Quick detection - returns just language code"""
-    result = detect_language(text)
-    return result.language
\ No newline at end of file
+    """Quick detection - returns just language code (cached per text)"""
+    key = hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+    with _quick_cache_lock:
+        lang = _quick_cache.get(key)
+        if lang is not None:
+            _quick_cache.move_to_end(key)
+            return lang
+
+    lang = detect_language(text).language
+    with _quick_cache_lock:
+        _quick_cache[key] = lang
+        if len(_quick_cache) > QUICK_DETECT_CACHE_SIZE:
+            _quick_cache.popitem(last=False)
+    return lang
\ No newline at end of file
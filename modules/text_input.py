@@ -22,6 +22,14 @@ import ftfy
 from loguru import logger
 
 
+# Precompiled patterns (used on every request)
+_MULTI_SPACE_RE = re.compile(r' +')
+# Allowed: Latin letters/numbers, Urdu/Arabic script, common punctuation, spaces
+_DISALLOWED_CHARS_RE = re.compile(
+    r'[^\w\s\.\,\!\?\'\"\-\:\;\u0600-\u06FF\u0750-\u077F\uFB50-\uFDFF\uFE70-\uFEFF]'
+)
+
+
 @dataclass
 class TextInputResult:
     """
@@ -221,7 +229,7 @@ class TextInputHandler:
         text = text.replace('\n', ' ').replace('\r', ' ').replace('\t', ' ')
         
         # Replace multiple spaces with single space
-        text = re.sub(r' +', ' ', text)
+        text = _MULTI_SPACE_RE.sub(' ', text)
         
         # Strip leading/trailing whitespace
         text = text.strip()
@@ -251,19 +259,12 @@ class TextInputHandler:
         Returns:
             Cleaned text
         """
-        # Define allowed character pattern
-        # This regex preserves:
-        # - Latin letters and numbers
-        # - Urdu/Arabic script
-        # - Common punctuation
-        # - Spaces
-        pattern = r'[^\w\s\.\,\!\?\'\"\-\:\;\u0600-\u06FF\u0750-\u077F\uFB50-\uFDFF\uFE70-\uFEFF]'
-        
-        # Remove characters not matching pattern
-        cleaned = re.sub(pattern, '', text)
+        # Remove characters not matching the allowed pattern
+        # (Latin letters/numbers, Urdu/Arabic script, common punctuation, spaces)
+        cleaned = _DISALLOWED_CHARS_RE.sub('', text)
         
         # Remove any resulting double spaces
-        cleaned = re.sub(r' +', ' ', cleaned)
+        cleaned = _MULTI_SPACE_RE.sub(' ', cleaned)
         
         return cleaned.strip()
     
@@ -2,7 +2,120 @@ import asyncio
 import edge_tts
 import os
 import abc
-import unidecode
+import hashlib
+import itertools
+import platform
+import re
+import shutil
+import subprocess
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from modules._device import configure_cpu_threads, detect_device, select_quantized_engine
+from modules._pool import SHARED_POOL
+from modules._urdu_map import URDU_FULL_MAP
+
+# Offline neural TTS (MMS) stack, imported once at module load
+try:
+    from transformers import VitsModel, AutoTokenizer
+    import torch
+    import scipy.io.wavfile as _sciowav
+    import numpy as np
+    _HAS_MMS = True
+except Exception:
+    # Broken installs (ABI mismatch, missing shared libs) raise more than ImportError
+    _HAS_MMS = False
+
+# 16-bit PCM WAV writer for MMS output (scipy fallback)
+try:
+    import soundfile
+except ImportError:
+    soundfile = None
+
+# Non-blocking file writes for streamed online audio (sync buffered write fallback)
+try:
+    import aiofiles
+except ImportError:
+    aiofiles = None
+
+# Online TTS throttling: global in-flight cap, request rate, 429 retries
+ONLINE_MAX_CONCURRENCY = 4
+ONLINE_RPS = 5.0
+RETRY_ATTEMPTS = 3
+RETRY_MIN_DELAY = 1.0
+RETRY_MAX_DELAY = 8.0
+# Longest MMS utterance served from the pinned GPU -> CPU buffer (longer ones copy normally)
+MMS_MAX_SECONDS = 60
+# MMS waveform cache for repeated short prompts (entries, total samples, max text length)
+MMS_CACHE_SIZE = 64
+MMS_CACHE_MAX_SAMPLES = 16000 * 600
+MMS_CACHE_MAX_CHARS = 200
+# ffmpeg (if installed) lets MMS write compressed audio directly.
+# MP3 matches Edge TTS output (24 kHz mono CBR 48 kbps, no Xing/ID3 header), so
+# MMS and Edge parts can be byte-concatenated into one consistent stream.
+_FFMPEG = shutil.which("ffmpeg")
+FFMPEG_CODECS = {
+    ".mp3": ("-codec:a", "libmp3lame", "-ar", "24000", "-b:a", "48k", "-write_xing", "0", "-id3v2_version", "0"),
+    ".ogg": ("-codec:a", "libopus"),
+}
+# Micro-batching of short offline texts (generate_speech(micro_batch=True))
+MICRO_BATCH_MAX_CHARS = 20
+MICRO_BATCH_SIZE = 8
+MICRO_BATCH_WINDOW = 0.1
+# Seconds an internet connectivity probe result is reused
+NET_CHECK_TTL = 30.0
+# pyttsx3 worker threads, one engine each (SAPI5 / NSSpeech instances are independent;
+# espeak is a process-wide C library, so Linux keeps a single engine)
+PYTTSX3_POOL_SIZE = 2 if platform.system() in ("Windows", "Darwin") else 1
+# Write buffer for streamed audio files
+WRITE_BUFFER_SIZE = 1 << 20
+
+
+def _is_rate_limited(error):
+    """True for HTTP 429 / quota errors from online TTS providers"""
+    if getattr(error, "status_code", None) == 429 or getattr(error, "status", None) == 429:
+        return True
+    message = str(error).lower()
+    return "429" in message or "quota" in message or "rate limit" in message
+
+# Urdu -> Roman transliteration for offline pyttsx3 playback (custom simple
+# mapping for better vowel retention); built once as a str.translate table
+URDU_MAP = str.maketrans({
+    'ا': 'a', 'آ': 'aa', 'ب': 'b', 'پ': 'p', 'ت': 't', 'ٹ': 't', 'ث': 's',
+    'ج': 'j', 'چ': 'ch', 'ح': 'h', 'خ': 'kh', 'د': 'd', 'ڈ': 'd', 'ذ': 'z',
+    'ر': 'r', 'ڑ': 'r', 'ز': 'z', 'ژ': 'zh', 'س': 's', 'ش': 'sh', 'ص': 's',
+    'ض': 'z', 'ط': 't', 'ظ': 'z', 'ع': 'a', 'غ': 'gh', 'ف': 'f', 'ق': 'q',
+    'ک': 'k', 'گ': 'g', 'ل': 'l', 'م': 'm', 'ن': 'n', 'و': 'o', 'ہ': 'h',
+    'ی': 'i', 'ے': 'ay', 'ھ': 'h', 'ء': "'", 'ں': 'n',
+    '۰': '0', '۱': '1', '۲': '2', '۳': '3', '۴': '4',
+    '۵': '5', '۶': '6', '۷': '7', '۸': '8', '۹': '9', '؟': '?'
+})
+# Full Arabic-script table underneath the custom mapping (no unidecode lookups)
+URDU_TRANSLIT = {**URDU_FULL_MAP, **URDU_MAP}
+
+# Output directories already created by this process (skips a mkdir syscall per call)
+_MADE_DIRS = set()
+
+
+def _ensure_parent(output_path):
+    parent = Path(output_path).parent
+    if parent not in _MADE_DIRS:
+        parent.mkdir(parents=True, exist_ok=True)
+        _MADE_DIRS.add(parent)
+
+
+def _is_nonempty(path):
+    """Exists and has content (one stat call)"""
+    try:
+        return os.stat(path).st_size > 0
+    except OSError:
+        return False
+
+# Any non-ASCII character (Urdu/Arabic script check, scanned in C)
+_NON_ASCII_RE = re.compile(r'[^\x00-\x7f]')
 
 # Abstract base class for TTS backends
 class TTSBackend(abc.ABC):
@@ -13,55 +126,59 @@ class TTSBackend(abc.ABC):
 class EdgeTTSBackend(TTSBackend):
     async def generate(self, text, voice, rate, output_path):
         # Edge TTS expects rate string like "+10%" or "-10%"
+        # Write chunks as they arrive instead of letting the event loop block on sync writes
+        if aiofiles is not None:
+            async with aiofiles.open(output_path, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+                async for chunk in self.stream(text, voice, rate):
+                    await f.write(chunk)
+        else:
+            with open(output_path, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+                async for chunk in self.stream(text, voice, rate):
+                    f.write(chunk)
+
+    async def stream(self, text, voice, rate):
+        """Yield MP3 bytes as Edge TTS produces them"""
         communicate = edge_tts.Communicate(text, voice, rate=rate)
-        await communicate.save(output_path)
+        async for chunk in communicate.stream():
+            if chunk["type"] == "audio":
+                yield chunk["data"]
 
 class Pyttsx3Backend(TTSBackend):
+    # pyttsx3 engines are tied to the thread that creates them (SAPI5 lives in that
+    # thread's COM apartment), so synthesis runs on a dedicated executor whose
+    # workers each create and drive their own engine
+    _executor = None
+    _executor_lock = threading.Lock()
+    _local = threading.local()
+
     def __init__(self):
-        import pyttsx3
-        # SINGLETON FIX: Only initialize pyttsx3 once per process
-        if not hasattr(Pyttsx3Backend, '_engine_instance'):
-             try:
-                Pyttsx3Backend._engine_instance = pyttsx3.init()
-                Pyttsx3Backend._engine_instance.setProperty('rate', 150)
-             except Exception as e:
-                print(f"Failed to init pyttsx3: {e}")
-                Pyttsx3Backend._engine_instance = None
-        
-        self.engine = Pyttsx3Backend._engine_instance
+        import pyttsx3  # noqa: F401 - fail fast when the package is missing
+        # SINGLETON FIX: Only create the pyttsx3 workers once per process
+        with Pyttsx3Backend._executor_lock:
+            if Pyttsx3Backend._executor is None:
+                Pyttsx3Backend._executor = ThreadPoolExecutor(
+                    max_workers=PYTTSX3_POOL_SIZE, thread_name_prefix="pyttsx3"
+                )
+        self.executor = Pyttsx3Backend._executor
     
     async def generate(self, text, voice, rate, output_path):
         # pyttsx3 handles rate as integer (words per minute), e.g. 150.
         
         # TRANSILITERATION LOGIC FOR OFFLINE URDU
         # Check if text contains non-ASCII characters (likely Urdu/Arabic)
-        if any(ord(c) > 127 for c in text):
+        if not text.isascii():
             # SAFE PRINT: Encode to avoid charmap errors on Windows
             safe_text = text[:20].encode('ascii', 'replace').decode('ascii')
             print(f"[WARN] Non-English text detected in offline mode: {safe_text}...")
             print("[INFO] Transliterating to Roman Urdu for basic playback...")
             try:
-                # Custom simple mapping for better vowel retention
-                mapping = {
-                    'ا': 'a', 'آ': 'aa', 'ب': 'b', 'پ': 'p', 'ت': 't', 'ٹ': 't', 'ث': 's',
-                    'ج': 'j', 'چ': 'ch', 'ح': 'h', 'خ': 'kh', 'د': 'd', 'ڈ': 'd', 'ذ': 'z',
-                    'ر': 'r', 'ڑ': 'r', 'ز': 'z', 'ژ': 'zh', 'س': 's', 'ش': 'sh', 'ص': 's',
-                    'ض': 'z', 'ط': 't', 'ظ': 'z', 'ع': 'a', 'غ': 'gh', 'ف': 'f', 'ق': 'q',
-                    'ک': 'k', 'گ': 'g', 'ل': 'l', 'م': 'm', 'ن': 'n', 'و': 'o', 'ہ': 'h',
-                    'ی': 'i', 'ے': 'ay', 'ھ': 'h', 'ء': "'", 'ں': 'n',
-                    '۰': '0', '۱': '1', '۲': '2', '۳': '3', '۴': '4',
-                    '۵': '5', '۶': '6', '۷': '7', '۸': '8', '۹': '9', '؟': '?'
-                }
-                
-                roman_text = ""
-                for char in text:
-                    if char in mapping:
-                        roman_text += mapping[char]
-                    else:
-                        roman_text += char
+                # Custom + precomputed Arabic-script mapping applied in one C-level pass
+                text = text.translate(URDU_TRANSLIT)
                 
-                # Use unidecode as a final cleanup for any missed chars, but our mapping handles main ones
-                text = unidecode.unidecode(roman_text)
+                # Other scripts (rare): fall back to unidecode
+                if not text.isascii():
+                    import unidecode
+                    text = unidecode.unidecode(text)
                 
                 # Add spaces between words if they were stuck together (simple heuristic)
                 # Not perfect but better than nothing
@@ -72,26 +189,47 @@ class Pyttsx3Backend(TTSBackend):
                 print(f"[ERROR] Transliteration failed: {e}")
 
         # Ensure output directory exists (pyttsx3 might not create it)
-        os.makedirs(os.path.dirname(output_path), exist_ok=True)
-        
-        if os.path.exists(output_path):
-            os.remove(output_path)
+        _ensure_parent(output_path)
+        Path(output_path).unlink(missing_ok=True)
+
+        # Synthesis blocks for its whole duration: keep it off the event loop
+        await asyncio.get_running_loop().run_in_executor(self.executor, self._save, text, output_path)
 
-        self.engine.save_to_file(text, output_path)
-        self.engine.runAndWait()
+    @staticmethod
+    def _thread_engine():
+        """This worker thread's engine, created on first use (on this thread)"""
+        engine = getattr(Pyttsx3Backend._local, "engine", None)
+        if engine is None:
+            import pyttsx3
+            if platform.system() == "Windows":
+                import comtypes
+                comtypes.CoInitialize()
+            try:
+                # init() caches one engine per driver process-wide; Engine() is this thread's own
+                engine = pyttsx3.Engine()
+                engine.setProperty('rate', 150)
+            except Exception as e:
+                raise RuntimeError(f"pyttsx3 engine unavailable: {e}") from e
+            Pyttsx3Backend._local.engine = engine
+        return engine
+
+    def _save(self, text, output_path):
+        engine = self._thread_engine()
+        engine.save_to_file(text, output_path)
+        engine.runAndWait()
 
 class MMSBackend(TTSBackend):
     def __init__(self, language="urdu"):
+        if not _HAS_MMS:
+            print("[ERROR] MMS-TTS dependencies missing (transformers, torch, scipy, numpy)")
+            raise ImportError("MMS-TTS requires transformers, torch, scipy and numpy")
         try:
-            from transformers import VitsModel, AutoTokenizer
-            import torch
-            import scipy.io.wavfile
-            import numpy as np
-            
-            self.scipy_write = scipy.io.wavfile.write
             # Check for GPU
             self.device = "cuda" if torch.cuda.is_available() else "cpu"
             print(f"[INFO] MMS-TTS ({language}) initializing on {self.device}...")
+            if self.device == "cpu":
+                # Process-wide: also caps torch threads for EasyOCR in the same process
+                configure_cpu_threads()
             
             # Load model - will download on first run (~50MB - 100MB)
             if language == "english":
@@ -103,48 +241,205 @@ class MMSBackend(TTSBackend):
             self.model = VitsModel.from_pretrained(self.model_id).to(self.device)
             
             # ⚡ OPTIMIZATION: Apply Dynamic Quantization for CPU Speedup (1.5x - 2x faster)
-            if self.device == "cpu":
+            # Only with a native int8 engine (fbgemm/qnnpack), and only the attention /
+            # feed-forward Linear layers: embeddings, convs and the vocoder stay FP32
+            quantized = False
+            if self.device == "cpu" and select_quantized_engine():
                 print(f"[INFO] Applying Quantization to MMS Model ({language})...")
-                self.model = torch.quantization.quantize_dynamic(
-                    self.model, {torch.nn.Linear}, dtype=torch.qint8
+                targets = {
+                    name: torch.quantization.default_dynamic_qconfig
+                    for name, module in self.model.named_modules()
+                    if isinstance(module, torch.nn.Linear) and ("attention" in name or "feed_forward" in name)
+                }
+                if targets:
+                    self.model = torch.quantization.quantize_dynamic(self.model, targets, dtype=torch.qint8)
+                    quantized = True
+
+            # Eager model stays around as the fallback if a compiled call fails
+            self._eager_model = self.model
+            # Dynamic int8 Linear layers don't trace reliably under torch.compile: keep them eager
+            if not quantized:
+                self._compile_model("warm up" if language == "english" else "سلام")
+
+            # Forward passes run on worker threads; the model, cache and pinned buffer are shared
+            self._lock = threading.Lock()
+
+            # Repeated short prompts skip the forward pass: blake2b(text) -> waveform
+            self._cache = OrderedDict()
+            self._cache_samples = 0
+
+            # Pinned host buffer for async GPU -> CPU waveform copies (CPU tensors are read in place)
+            self._host_buf = None
+            if self.device == "cuda":
+                self._host_buf = torch.empty(
+                    MMS_MAX_SECONDS * self.model.config.sampling_rate, dtype=torch.float32, pin_memory=True
                 )
                 
             print(f"[SUCCESS] MMS-TTS ({language}) loaded successfully.")
             
-        except ImportError as e:
-            print(f"[ERROR] MMS-TTS dependencies missing: {e}")
-            raise e
         except Exception as e:
             print(f"[ERROR] Failed to load MMS model ({language}): {e}")
             raise e
 
-    async def generate(self, text, voice, rate, output_path):
-        import torch
-        
-        inputs = self.tokenizer(text, return_tensors="pt")
-        inputs = inputs.to(self.device)
+    def _compile_model(self, sample_text):
+        """⚡ OPTIMIZATION: torch.compile the VITS model (fused ops, CUDA graphs on GPU).
+        Compilation is lazy, so a warm-up forward triggers it here; any failure keeps eager mode."""
+        if not hasattr(torch, "compile"):
+            return
+        eager_model = self.model
+        mode = "reduce-overhead" if self.device == "cuda" else "default"
+        try:
+            self.model = torch.compile(eager_model, mode=mode, dynamic=True)
+            with torch.no_grad():
+                self.model(**self.tokenizer(sample_text, return_tensors="pt").to(self.device))
+            print(f"[INFO] MMS model compiled ({mode})")
+        except Exception as e:
+            print(f"[WARN] torch.compile skipped for MMS: {e}")
+            self.model = eager_model
 
+    def _forward(self, inputs):
+        """Model forward without grad; a compiled model that fails (e.g. on a new shape) is dropped for eager"""
         with torch.no_grad():
-            output = self.model(**inputs).waveform
-        
-        # Convert to numpy and save
-        waveform = output.cpu().numpy().squeeze()
+            try:
+                return self.model(**inputs)
+            except Exception as e:
+                if self.model is self._eager_model:
+                    raise
+                print(f"[WARN] Compiled MMS model failed, switching to eager: {e}")
+                self.model = self._eager_model
+                return self.model(**inputs)
+
+    def _to_host(self, tensor):
+        """Waveform tensor -> numpy; zero-copy on CPU, pinned non_blocking copy on GPU.
+        The result may alias the pinned buffer: write it out before the next call."""
+        if tensor.device.type != "cuda":
+            return tensor.numpy()
+        if self._host_buf is None or tensor.numel() > self._host_buf.numel():
+            return tensor.cpu().numpy()
+        host = self._host_buf[:tensor.numel()]
+        host.copy_(tensor.reshape(-1), non_blocking=True)
+        torch.cuda.current_stream().synchronize()
+        return host.numpy().reshape(tuple(tensor.shape))
+
+    def _write_wav(self, output_path, rate, waveform):
+        """Save as 16-bit PCM (half the bytes of float32 WAV, no audible loss at 16 kHz)"""
+        pcm = np.clip(waveform, -1.0, 1.0)
+        pcm = (pcm * 32767.0).astype(np.int16, copy=False)
+        if soundfile is not None:
+            soundfile.write(output_path, pcm, rate, subtype="PCM_16")
+        else:
+            _sciowav.write(output_path, rate, pcm)
+
+    def _write_encoded(self, output_path, rate, waveform):
+        """Pipe float32 samples into ffmpeg for the requested codec; False if not applicable or failed"""
+        codec = FFMPEG_CODECS.get(os.path.splitext(output_path)[1].lower())
+        if codec is None or _FFMPEG is None:
+            return False
+        cmd = [
+            _FFMPEG, "-loglevel", "error", "-f", "f32le", "-ar", str(rate), "-ac", "1", "-i", "-",
+            *codec, "-y", output_path,
+        ]
+        try:
+            proc = subprocess.run(cmd, input=waveform.astype(np.float32, copy=False).tobytes(), capture_output=True)
+        except OSError as e:
+            print(f"[WARN] ffmpeg encode failed, writing WAV: {e}")
+            return False
+        if proc.returncode != 0:
+            print(f"[WARN] ffmpeg encode failed, writing WAV: {proc.stderr.decode(errors='replace').strip()}")
+            return False
+        return True
+
+    def _cache_get(self, key):
+        waveform = self._cache.get(key)
+        if waveform is not None:
+            self._cache.move_to_end(key)
+        return waveform
+
+    def _cache_put(self, key, waveform):
+        if waveform.size > MMS_CACHE_MAX_SAMPLES:
+            return
+        # Copy: the waveform may alias the reusable pinned buffer
+        self._cache[key] = waveform.copy()
+        self._cache_samples += waveform.size
+        while len(self._cache) > MMS_CACHE_SIZE or self._cache_samples > MMS_CACHE_MAX_SAMPLES:
+            _, evicted = self._cache.popitem(last=False)
+            self._cache_samples -= evicted.size
+
+    def _synthesize(self, text):
+        """Text -> numpy waveform (cached for short prompts); blocking, run on a worker thread"""
+        key = None
+        if len(text) <= MMS_CACHE_MAX_CHARS:
+            key = hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+        with self._lock:
+            waveform = self._cache_get(key) if key is not None else None
+            if waveform is None:
+                inputs = self.tokenizer(text, return_tensors="pt")
+                inputs = inputs.to(self.device)
+
+                output = self._forward(inputs).waveform
+
+                # Convert to numpy
+                waveform = self._to_host(output.squeeze())
+                if key is not None:
+                    self._cache_put(key, waveform)
+                if self._host_buf is not None:
+                    # The pinned buffer is reused by the next call once the lock is released
+                    waveform = waveform.copy()
+        return waveform
+
+    async def generate(self, text, voice, rate, output_path):
+        # ⚡ OPTIMIZATION: the forward pass runs on a worker thread, so the shared
+        # event loop keeps serving other jobs and streams meanwhile
+        loop = asyncio.get_running_loop()
+        waveform = await loop.run_in_executor(SHARED_POOL, self._synthesize, text)
         
         # Ensure output dir
-        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        _ensure_parent(output_path)
         
         # Save as WAV (MMS is 16kHz usually)
         # Note: transformers VITS config usually has sampling_rate
         rate = self.model.config.sampling_rate
         
-        # If output_path is .mp3, we might need ffmpeg or just save as wav and rename (player might handle it)
-        # Ideally, we save as .wav for quality.
+        # ⚡ OPTIMIZATION: .mp3/.ogg requested -> encode straight from memory with ffmpeg
+        # (no intermediate WAV). Without ffmpeg, save as .wav instead.
+        # The encode blocks until ffmpeg exits: keep it off the shared event loop
+        if await loop.run_in_executor(SHARED_POOL, self._write_encoded, output_path, rate, waveform):
+            return output_path
         if output_path.endswith(".mp3"):
             output_path = output_path.replace(".mp3", ".wav")
             
-        self.scipy_write(output_path, rate, waveform)
+        await loop.run_in_executor(SHARED_POOL, self._write_wav, output_path, rate, waveform)
         return output_path
 
+    async def generate_batch(self, texts, output_paths):
+        """Synthesize several texts in one padded forward pass; returns the WAV paths written"""
+        return await asyncio.get_running_loop().run_in_executor(
+            SHARED_POOL, self._generate_batch, texts, output_paths
+        )
+
+    def _generate_batch(self, texts, output_paths):
+        with self._lock:
+            inputs = self.tokenizer(texts, return_tensors="pt", padding=True)
+            inputs = inputs.to(self.device)
+            output = self._forward(inputs)
+
+            # Rows are padded to the longest utterance; sequence_lengths holds each row's real length
+            waveforms = self._to_host(output.waveform)
+            if self._host_buf is not None:
+                waveforms = waveforms.copy()
+        lengths = output.sequence_lengths.cpu().numpy()
+        rate = self.model.config.sampling_rate
+
+        written = []
+        for waveform, length, output_path in zip(waveforms, lengths, output_paths):
+            if output_path.endswith(".mp3"):
+                output_path = output_path.replace(".mp3", ".wav")
+            _ensure_parent(output_path)
+            self._write_wav(output_path, rate, waveform[:int(length)])
+            written.append(output_path)
+        return written
+
 
 class OpenAITTSBackend(TTSBackend):
     def __init__(self, api_key=None):
@@ -152,6 +447,10 @@ class OpenAITTSBackend(TTSBackend):
         self.client = OpenAI(api_key=api_key or os.getenv("OPENAI_API_KEY"))
 
     async def generate(self, text, voice, rate, output_path):
+        # Sync HTTP client: run off the event loop
+        await asyncio.get_running_loop().run_in_executor(SHARED_POOL, self._generate, text, voice, output_path)
+
+    def _generate(self, text, voice, output_path):
         response = self.client.audio.speech.create(
             model="tts-1-hd",
             voice=voice or "alloy",
@@ -165,29 +464,59 @@ class ElevenLabsBackend(TTSBackend):
         self.client = ElevenLabs(api_key=api_key or os.getenv("ELEVEN_API_KEY"))
 
     async def generate(self, text, voice, rate, output_path):
+        # The SDK iterator does blocking HTTP reads: drain it off the event loop
+        await asyncio.get_running_loop().run_in_executor(SHARED_POOL, self._generate, text, voice, output_path)
+
+    def _generate(self, text, voice, output_path):
         audio = self.client.generate(
             text=text,
             voice=voice or "Rachel",
             model="eleven_multilingual_v2"
         )
-        with open(output_path, "wb") as f:
+        with open(output_path, "wb", buffering=WRITE_BUFFER_SIZE) as f:
             for chunk in audio:
                 if chunk:
                     f.write(chunk)
 
 class XTTSBackend(TTSBackend):
+    DEFAULT_SPEAKER = "Ana Helena Tanios"
+
     def __init__(self):
+        import tempfile
         from TTS.api import TTS
-        self.tts = TTS("tts_models/multilingual/multi-dataset/xtts_v2", gpu=False)
+
+        self.device = "cuda" if detect_device() == "cuda" else "cpu"
+        self.tts = TTS("tts_models/multilingual/multi-dataset/xtts_v2", gpu=(self.device == "cuda"))
+
+        if self.device == "cuda":
+            # FP16 GPT + vocoder: ~2x throughput, half the VRAM
+            warm_path = os.path.join(tempfile.gettempdir(), "xtts_warmup.wav")
+            fp32_model = self.tts.synthesizer.tts_model
+            try:
+                self.tts.synthesizer.tts_model = fp32_model.half()
+                # One-shot warm-up so the first request doesn't pay cuDNN autotune
+                self.tts.tts_to_file(text="warmup.", speaker=self.DEFAULT_SPEAKER, language="en", file_path=warm_path)
+                print(f"[INFO] XTTS loaded on {self.device} (fp16)")
+            except Exception as e:
+                # Some GPUs/checkpoints can't run the model in FP16: stay in FP32
+                print(f"[WARN] XTTS fp16 skipped, using fp32: {e}")
+                self.tts.synthesizer.tts_model = fp32_model.float()
+
+        # The Coqui synthesizer isn't thread-safe: one inference at a time
+        self._lock = threading.Lock()
 
     async def generate(self, text, voice, rate, output_path):
-        self.tts.tts_to_file(text=text, speaker=voice or "Ana Helena Tanios", language="en", file_path=output_path)
+        # Inference blocks for the whole utterance: keep it off the event loop
+        await asyncio.get_running_loop().run_in_executor(SHARED_POOL, self._generate, text, voice, output_path)
+
+    def _generate(self, text, voice, output_path):
+        with self._lock:
+            self.tts.tts_to_file(text=text, speaker=voice or self.DEFAULT_SPEAKER, language="en", file_path=output_path)
 
 class TTSEngine:
-    def __init__(self, backend_type="edge"):
+    def __init__(self, backend_type="edge", max_concurrency=ONLINE_MAX_CONCURRENCY, rps=ONLINE_RPS):
         self.output_dir = "assets"
-        if not os.path.exists(self.output_dir):
-            os.makedirs(self.output_dir)
+        Path(self.output_dir).mkdir(parents=True, exist_ok=True)
         
         self.backend_type = backend_type.lower()
         
@@ -201,12 +530,32 @@ class TTSEngine:
         # Pre-load Neural Backend for offline Urdu/English (lazy load)
         self.neural_urdu_backend = None
         self.neural_english_backend = None
+        # In-flight background loads, one per language (concurrent calls share them)
+        self._neural_tasks = {}
+        # MMS languages that can never load here (dependencies missing): not retried
+        self._neural_unavailable = set()
+        # Short texts waiting for the next MMS micro-batch: (text, language, future)
+        self._pending = []
+        self._flush_handle = None
+        self.offline_backend = None
 
         self.edge_voices = {
             "english": "en-US-AriaNeural",
             "urdu": "ur-PK-AsadNeural"
         }
 
+        # Online provider throttling (shared by every request on this engine)
+        self._sem = asyncio.Semaphore(max_concurrency)
+        self._min_interval = 1.0 / rps
+        self._next_slot = 0.0
+        # (monotonic time of last probe, result)
+        self._net_cache = (float("-inf"), False)
+
+        # Audio player resolved once, not per play_audio call
+        self._play = self._pick_player()
+        # Unique default filenames (concurrent calls never overwrite each other)
+        self._counter = itertools.count()
+
     def get_backend(self, backend_type):
         if backend_type == "pyttsx3" or backend_type == "offline":
             return Pyttsx3Backend()
@@ -221,32 +570,38 @@ class TTSEngine:
         else:
             return EdgeTTSBackend()
 
-    async def generate_speech(self, text, language="english", rate="+0%", filename="output.mp3", voice=None):
-        """Generates speech - tries online, falls back to offline human-like (MMS), then offline robotic (pyttsx3)"""
-        import time
-        import socket
+    async def generate_speech(self, text, language="english", rate="+0%", filename=None, voice=None, micro_batch=False,
+                              return_tier=False):
+        """Generates speech - tries online, falls back to offline human-like (MMS), then offline robotic (pyttsx3)
+        Returns None for empty/whitespace text. With micro_batch=True, short offline texts arriving
+        within MICRO_BATCH_WINDOW of each other share one MMS forward pass (filename is then generated).
+        With return_tier=True, returns (path, tier) where tier is "online", "neural" or "system"."""
+        path, tier = await self._generate_speech(text, language, rate, filename, voice, micro_batch)
+        return (path, tier) if return_tier else path
+
+    async def _generate_speech(self, text, language, rate, filename, voice, micro_batch):
+        if not text or not text.strip():
+            return None, None
         start_t = time.time()
         
+        filename = filename or self._next_filename(language)
         output_path = os.path.join(self.output_dir, filename)
         
         if not voice and self.backend_type == "edge":
             voice = self.edge_voices.get(language.lower(), self.edge_voices["english"])
         
-        # ⚡ OPTIMIZATION: Robust Internet Check (Try Google then Cloudflare)
-        can_use_online = False
-        if self.backend_type == "edge":
+        target_lang = self._neural_language(text, language)
+        can_use_online = self.backend_type == "edge" and await self._check_online()
+        # ⚡ OPTIMIZATION: offline, start loading the Tier 2 model right away
+        # (online, it is only loaded if Tier 1 actually fails)
+        if not can_use_online:
+            self._start_neural_load(target_lang)
+        
+        if micro_batch and not can_use_online and len(text) < MICRO_BATCH_MAX_CHARS:
             try:
-                # Primary Check
-                socket.create_connection(("www.google.com", 80), timeout=1.5)
-                can_use_online = True
-            except OSError:
-                try:
-                    # Backup Check (Cloudflare DNS)
-                    socket.create_connection(("1.1.1.1", 53), timeout=1.5)
-                    can_use_online = True
-                except OSError:
-                    print("[WARN] No Internet detected (Double Check Failed). Skipping Online TTS.")
-                    can_use_online = False
+                return await self._micro_batch(text, language), "neural"
+            except Exception as e:
+                print(f"[WARN] Micro-batch failed, generating alone: {e}")
         
         # ---------------------------------------------------------
         # TIER 1: Online (Edge TTS) - Best Quality
@@ -254,12 +609,12 @@ class TTSEngine:
         try:
             if can_use_online:
                 print(f"[INFO] [TIER 1] Starting Online TTS ({self.backend_type})...")
-                await self.backend.generate(text, voice, rate, output_path)
+                await self._generate_online(text, voice, rate, output_path)
                 
                 # Verify file
-                if os.path.exists(output_path) and os.path.getsize(output_path) > 0:
+                if _is_nonempty(output_path):
                     print(f"[INFO] TTS Generation took {time.time() - start_t:.2f}s")
-                    return output_path
+                    return output_path, "online"
                 else:
                     raise Exception("Generated audio file is empty")
             else:
@@ -267,35 +622,27 @@ class TTSEngine:
                  
         except Exception as e:
             print(f"[WARN] [TIER 1] Online TTS failed: {e}")
+            # Drop any partial download so it can't be mistaken for a result
+            try:
+                os.remove(output_path)
+            except OSError:
+                pass
 
         # ---------------------------------------------------------
         # TIER 2: Offline Human-Like (MMS Neural) - High Quality
         # ---------------------------------------------------------
         print("[INFO] [TIER 2] Attempting Neural Offline TTS (MMS)...")
         
-        wav_path = output_path.replace(".mp3", ".wav") # MMS outputs WAV
-        
         try:
-            is_urdu = any(ord(c) > 127 for c in text) or "urdu" in language.lower()
-            target_lang = "urdu" if is_urdu else "english"
-            
-            # Lazy Load the correct backend
-            backend_attr = f"neural_{target_lang}_backend"
-            current_backend = getattr(self, backend_attr)
-            
-            if not current_backend:
-                print(f"[INFO] Initializing {target_lang} Neural Model (First Run)...")
-                init_t = time.time()
-                current_backend = MMSBackend(language=target_lang)
-                setattr(self, backend_attr, current_backend)
-                print(f"[INFO] Neural Init took {time.time() - init_t:.2f}s")
+            current_backend = await self._get_neural_backend(target_lang)
             
             gen_t = time.time()
-            await current_backend.generate(text, None, rate, wav_path)
+            # MMS encodes to the requested format with ffmpeg, else falls back to .wav
+            neural_path = await current_backend.generate(text, None, rate, output_path)
             print(f"[INFO] Neural Generate took {time.time() - gen_t:.2f}s")
             
-            if os.path.exists(wav_path) and os.path.getsize(wav_path) > 0:
-                return wav_path
+            if _is_nonempty(neural_path):
+                return neural_path, "neural"
             else:
                 raise Exception("Neural output empty")
 
@@ -307,22 +654,252 @@ class TTSEngine:
         # ---------------------------------------------------------
         print("[WARN] [TIER 3] Switching to System Fallback (pyttsx3)...")
         try:
-            offline_backend = Pyttsx3Backend()
-            await offline_backend.generate(text, None, rate, output_path)
+            if self.offline_backend is None:
+                self.offline_backend = Pyttsx3Backend()
+            await self.offline_backend.generate(text, None, rate, output_path)
             print(f"[INFO] Backup Generate took {time.time() - start_t:.2f}s")
-            return output_path
+            return output_path, "system"
         except Exception as ev:
             print(f"[ERROR] [TIER 3] All TTS methods failed: {ev}")
             raise ev
 
+    def _next_filename(self, language, ext="mp3"):
+        """Collision-free output name: nanosecond timestamp + per-engine counter"""
+        return f"audio_{language.lower()}_{time.time_ns()}_{next(self._counter)}.{ext}"
+
+    def _neural_language(self, text, language):
+        """MMS model to use for this text: 'urdu' or 'english'"""
+        is_urdu = _NON_ASCII_RE.search(text) is not None or "urdu" in language.lower()
+        return "urdu" if is_urdu else "english"
+
+    def _start_neural_load(self, target_lang):
+        """Load the MMS backend for target_lang in a worker thread (once); returns the task,
+        or None if already loaded or permanently unavailable"""
+        if getattr(self, f"neural_{target_lang}_backend") or not _HAS_MMS or target_lang in self._neural_unavailable:
+            return None
+        task = self._neural_tasks.get(target_lang)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.ensure_future(self._load_neural(target_lang))
+            self._neural_tasks[target_lang] = task
+        return task
+
+    async def _load_neural(self, target_lang):
+        print(f"[INFO] Initializing {target_lang} Neural Model (First Run)...")
+        init_t = time.time()
+        try:
+            backend = await asyncio.get_running_loop().run_in_executor(SHARED_POOL, MMSBackend, target_lang)
+        except Exception as e:
+            # Drop the task so the next call retries; report failure via None (no unretrieved exception).
+            # Missing dependencies won't fix themselves: remember those and stop retrying.
+            self._neural_tasks.pop(target_lang, None)
+            if isinstance(e, ImportError):
+                self._neural_unavailable.add(target_lang)
+            print(f"[ERROR] {target_lang} Neural Model failed to load: {e}")
+            return None
+        setattr(self, f"neural_{target_lang}_backend", backend)
+        self._neural_tasks.pop(target_lang, None)
+        print(f"[INFO] Neural Init took {time.time() - init_t:.2f}s")
+        return backend
+
+    async def _get_neural_backend(self, target_lang):
+        """Lazy Load the correct MMS backend (waits for an in-flight background load)"""
+        current_backend = getattr(self, f"neural_{target_lang}_backend")
+        if not current_backend:
+            task = self._start_neural_load(target_lang)
+            current_backend = await task if task is not None else None
+            if current_backend is None:
+                raise Exception(f"{target_lang} Neural Model unavailable")
+        return current_backend
+
+    async def _generate_neural_batch(self, texts, language):
+        """Offline batch: one padded MMS forward per target language"""
+        groups = {}
+        for i, text in enumerate(texts):
+            groups.setdefault(self._neural_language(text, language), []).append(i)
+
+        paths = [None] * len(texts)
+        for target_lang, indices in groups.items():
+            backend = await self._get_neural_backend(target_lang)
+            gen_t = time.time()
+            written = await backend.generate_batch(
+                [texts[i] for i in indices],
+                [os.path.join(self.output_dir, self._next_filename(language, "wav")) for _ in indices],
+            )
+            print(f"[INFO] Neural Batch of {len(indices)} took {time.time() - gen_t:.2f}s")
+            for i, path in zip(indices, written):
+                paths[i] = path
+        return paths
+
+    def _micro_batch(self, text, language):
+        """Queue a short text for the next MMS micro-batch; returns a future for its path"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((text, language, future))
+        if len(self._pending) >= MICRO_BATCH_SIZE:
+            self._flush_micro_batch()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(MICRO_BATCH_WINDOW, self._flush_micro_batch)
+        return future
+
+    def _flush_micro_batch(self):
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        pending, self._pending = self._pending, []
+        if pending:
+            asyncio.ensure_future(self._run_micro_batch(pending))
+
+    async def _run_micro_batch(self, pending):
+        by_language = {}
+        for item in pending:
+            by_language.setdefault(item[1], []).append(item)
+        for language, items in by_language.items():
+            try:
+                paths = await self._generate_neural_batch([text for text, _, _ in items], language)
+            except Exception as e:
+                for _, _, future in items:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            for (_, _, future), path in zip(items, paths):
+                if not future.done():
+                    future.set_result(path)
+
+    async def generate_speech_batch(self, texts, language="english", rate="+0%"):
+        """Generate several utterances concurrently; returns one path per text (None where it failed).
+        Online calls stay bounded by the engine's semaphore and rate limit.
+        Offline, texts go through MMS as padded batches instead of one forward each."""
+        if texts and not (self.backend_type == "edge" and await self._check_online()):
+            try:
+                return await self._generate_neural_batch(texts, language)
+            except Exception as e:
+                print(f"[WARN] [TIER 2] Neural batch failed, generating one by one: {e}")
+
+        tasks = [
+            self.generate_speech(text, language, rate)
+            for text in texts
+        ]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        paths = []
+        for text, result in zip(texts, results):
+            if isinstance(result, BaseException):
+                print(f"[ERROR] Batch TTS failed for '{text[:20]}...': {result}")
+                paths.append(None)
+            else:
+                paths.append(result)
+        return paths
+
+    async def _ratelimit(self):
+        """Reserve the next request slot (at most `rps` starts per second)"""
+        now = time.monotonic()
+        slot = max(self._next_slot, now)
+        self._next_slot = slot + self._min_interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+    async def _generate_online(self, text, voice, rate, output_path):
+        """Online backend call under the concurrency cap + rate limit, retrying 429s with backoff"""
+        delay = RETRY_MIN_DELAY
+        for attempt in range(RETRY_ATTEMPTS + 1):
+            async with self._sem:
+                await self._ratelimit()
+                try:
+                    return await self.backend.generate(text, voice, rate, output_path)
+                except Exception as e:
+                    if attempt == RETRY_ATTEMPTS or not _is_rate_limited(e):
+                        raise
+                    print(f"[WARN] [TIER 1] Rate limited, retrying in {delay:.1f}s: {e}")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, RETRY_MAX_DELAY)
+
+    async def can_stream_online(self):
+        """True when Tier 1 (Edge TTS) is configured and reachable, so output will be MP3"""
+        return self.backend_type == "edge" and await self._check_online()
+
+    async def _check_online(self):
+        """⚡ OPTIMIZATION: Non-blocking internet check (Cloudflare DNS, then Google), cached for NET_CHECK_TTL seconds"""
+        checked_at, ok = self._net_cache
+        if time.monotonic() - checked_at < NET_CHECK_TTL:
+            return ok
+
+        ok = False
+        for host, port in (("1.1.1.1", 53), ("www.google.com", 80)):
+            try:
+                _, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout=1.0)
+                writer.close()
+                ok = True
+                break
+            except (OSError, asyncio.TimeoutError):
+                continue
+        if not ok:
+            print("[WARN] No Internet detected (Double Check Failed). Skipping Online TTS.")
+        self._net_cache = (time.monotonic(), ok)
+        return ok
+
+    async def stream_speech(self, text, language="english", rate="+0%", filename=None, voice=None, chunk_size=64 * 1024):
+        """Yields audio bytes as soon as synthesis starts (Edge TTS).
+        Offline tiers can't stream, so they generate the file and stream it back
+        (deleting it afterwards unless a filename was given)."""
+        if not text or not text.strip():
+            return
+        sent = False
+        if self.backend_type == "edge" and await self._check_online():
+            voice = voice or self.edge_voices.get(language.lower(), self.edge_voices["english"])
+            try:
+                async with self._sem:
+                    await self._ratelimit()
+                    async for chunk in self.backend.stream(text, voice, rate):
+                        sent = True
+                        yield chunk
+                return
+            except Exception as e:
+                if sent:
+                    raise
+                print(f"[WARN] [TIER 1] Online TTS stream failed: {e}")
+
+        path = await self.generate_speech(text, language=language, rate=rate, filename=filename, voice=voice)
+        try:
+            with open(path, "rb") as f:
+                while True:
+                    chunk = f.read(chunk_size)
+                    if not chunk:
+                        break
+                    yield chunk
+        finally:
+            if filename is None:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+    @staticmethod
+    def _pick_player():
+        """Resolve the platform audio player once; returns None if there isn't one"""
+        system = platform.system()
+        if system == "Windows":
+            return os.startfile
+        if system == "Darwin":
+            return lambda path: subprocess.Popen(["afplay", path])
+        if shutil.which("mpg123"):
+            return lambda path: subprocess.Popen(["mpg123", "-q", path])
+        if shutil.which("ffplay"):
+            return lambda path: subprocess.Popen(["ffplay", "-nodisp", "-autoexit", "-loglevel", "quiet", path])
+        return None
+
     def play_audio(self, file_path):
-        """Plays the audio file"""
+        """Plays the audio file (non-blocking)"""
         if not os.path.exists(file_path):
             print(f"Error: File {file_path} not found.")
             return
         
-        # Simple playback check (optional)
         print(f"Audio ready at: {file_path}")
+        if self._play is None:
+            print("[WARN] No audio player found on this system")
+            return
+        try:
+            self._play(file_path)
+        except Exception as e:
+            print(f"[WARN] Playback failed: {e}")
 
 async def main():
     tts = TTSEngine(backend_type="edge")
@@ -3,7 +3,8 @@ Member 5 - ABBAS: Run the Backend API server
 Start the Flask REST API (bridge Frontend ↔ Backend).
 
 Usage:
-  python run_api.py
+  python run_api.py              (waitress, multi-threaded)
+  FLASK_DEBUG=True python run_api.py   (Flask dev server with reloader)
 
 Then call:
   GET  http://127.0.0.1:5000/api/v1/health
@@ -12,6 +13,7 @@ Then call:
   etc.
 """
 
+import os
 import sys
 from pathlib import Path
 
@@ -25,4 +27,16 @@ from api.app import create_app
 app = create_app()
 
 if __name__ == "__main__":
-    app.run(host="0.0.0.0", port=5000, debug=True)
+    host = os.getenv("FLASK_HOST", "0.0.0.0")
+    port = int(os.getenv("FLASK_PORT", "5000"))
+
+    if os.getenv("FLASK_DEBUG", "False").lower() == "true":
+        app.run(host=host, port=port, debug=True)
+    else:
+        try:
+            from waitress import serve
+        except ImportError:
+            print("[WARN] waitress not installed; using Flask's threaded server")
+            app.run(host=host, port=port, debug=False, threaded=True)
+        else:
+            serve(app, host=host, port=port, threads=int(os.getenv("WAITRESS_THREADS", "8")))
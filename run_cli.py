@@ -3,6 +3,8 @@ Main Application - TTS Voice Agent (Integrated System)
 Combines all team modules into one pipeline
 """
 
+import asyncio
+
 from config import startup, settings
 from modules.text_input import process_text
 from modules.file_extractor import extract_text as extract_from_file
@@ -30,15 +32,32 @@ def main():
     print(f"   • Audio Format: {settings.AUDIO_FORMAT.upper()}")
     print(f"   • Max File Size: {settings.MAX_FILE_SIZE_MB}MB")
     
-    # User input
-    print("\n" + "="*60)
-    print("📥 SELECT INPUT TYPE:")
-    print("="*60)
-    print("\n1. 📝 Direct Text Input")
-    print("2. 📄 PDF/DOCX File")
-    print("3. 🖼️  Image (Screenshot/Photo)")
-    
-    choice = input("\nChoose (1-3): ").strip()
+    # One engine + event loop for the whole session: loaded models, the
+    # internet-check cache and background warm-up carry over between inputs
+    loop = asyncio.new_event_loop()
+    try:
+        while True:
+            # User input
+            print("\n" + "="*60)
+            print("📥 SELECT INPUT TYPE:")
+            print("="*60)
+            print("\n1. 📝 Direct Text Input")
+            print("2. 📄 PDF/DOCX File")
+            print("3. 🖼️  Image (Screenshot/Photo)")
+            print("q. 🚪 Quit")
+            
+            choice = input("\nChoose (1-3, q): ").strip().lower()
+            if choice == "q":
+                break
+            process_input(choice, tts, loop)
+    finally:
+        loop.close()
+
+
+def process_input(choice, tts, loop):
+    """
+    One pass of the pipeline for the chosen input type
+    """
     
     # Step 1: Extract Text
     print("\n" + "="*60)
@@ -109,21 +128,25 @@ def main():
     print("="*60)
     
     print(f"🔊 Generating {lang_name} audio...")
-    tts_result = tts.generate_speech(text, lang)
+    try:
+        # generate_speech is async: run it on the session's loop
+        audio_path = loop.run_until_complete(
+            tts.generate_speech(text, language="urdu" if lang == "ur" else "english")
+        )
+    except Exception as e:
+        print(f"❌ TTS failed: {e}")
+        return
     
-    if tts_result.success:
-        print(f"✅ Audio generated successfully!")
-        print(f"   • File: {tts_result.audio_path}")
-        print(f"   • Language: {tts_result.language}")
-        print(f"   • Mode: {tts_result.mode}")
-        
-        # Play audio
-        play_choice = input("\n▶️  Play audio now? (y/n): ").strip().lower()
-        if play_choice == 'y':
-            print("🔊 Playing audio...")
-            tts.play_audio(tts_result.audio_path)
-    else:
-        print(f"❌ TTS failed: {tts_result.error}")
+    print(f"✅ Audio generated successfully!")
+    print(f"   • File: {audio_path}")
+    print(f"   • Language: {lang_name}")
+    print(f"   • Format: {audio_path.rsplit('.', 1)[-1].upper()}")
+    
+    # Play audio
+    play_choice = input("\n▶️  Play audio now? (y/n): ").strip().lower()
+    if play_choice == 'y':
+        print("🔊 Playing audio...")
+        tts.play_audio(audio_path)
     
     print("\n" + "="*60)
     print("✅ PROCESS COMPLETED")
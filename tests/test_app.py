@@ -0,0 +1,54 @@
+"""
+API tests (run: python -m unittest discover tests)
+"""
+
+import unittest
+import uuid
+from pathlib import Path
+from unittest import mock
+
+from api import app as app_module
+from api.services import ASSETS_DIR
+
+
+class ServeAudioTest(unittest.TestCase):
+    def setUp(self):
+        self.audio_path = Path(ASSETS_DIR) / f"test_{uuid.uuid4().hex}.mp3"
+        self.audio_path.write_bytes(b"ID3test")
+
+    def tearDown(self):
+        self.audio_path.unlink(missing_ok=True)
+
+    def test_x_sendfile_header_when_enabled(self):
+        with mock.patch.object(app_module, "USE_X_SENDFILE", True):
+            client = app_module.create_app().test_client()
+        response = client.get(f"/api/v1/audio/{self.audio_path.name}")
+        self.addCleanup(response.close)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers.get("X-Sendfile"), str(self.audio_path.resolve()))
+        self.assertEqual(response.data, b"")
+
+    def test_file_body_when_disabled(self):
+        with mock.patch.object(app_module, "USE_X_SENDFILE", False):
+            client = app_module.create_app().test_client()
+        response = client.get(f"/api/v1/audio/{self.audio_path.name}")
+        self.addCleanup(response.close)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("X-Sendfile", response.headers)
+        self.assertEqual(response.data, b"ID3test")
+
+
+class StreamUploadTest(unittest.TestCase):
+    def test_malformed_multipart_is_bad_request(self):
+        client = app_module.create_app().test_client()
+        response = client.post(
+            "/api/v1/extract/file",
+            data=b"garbage",
+            content_type="multipart/form-data; boundary=zzz",
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(response.get_json()["success"])
+
+
+if __name__ == "__main__":
+    unittest.main()